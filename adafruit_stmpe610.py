@@ -59,6 +59,7 @@ _STMPE_VERSION = const(0x0811)
 
 _STMPE_SYS_CTRL1 = const(0x03)
 _STMPE_SYS_CTRL1_RESET = const(0x02)
+_STMPE_SYS_CTRL1_HIBERNATE = const(0x01)
 _STMPE_SYS_CTRL2 = const(0x04)
 
 _STMPE_TSC_CTRL = const(0x40)
@@ -142,6 +143,23 @@ _STMPE_GPIO_CLR_PIN = const(0x11)
 _STMPE_GPIO_DIR = const(0x13)
 _STMPE_GPIO_ALT_FUNCT = const(0x17)
 
+# Pre-built init packets: each holds a register address followed by the
+# value(s) written there, ready to send in one transaction. All addresses have
+# bit 7 low so the same literals serve as SPI write packets, and on
+# CircuitPython the literals live in flash - no RAM or per-boot arithmetic.
+_RESET_PKT = b"\x03\x02"  # SYS_CTRL1: soft reset
+_INIT_SEQ = (
+    b"\x04\x00",  # SYS_CTRL2: turn on clocks!
+    b"\x40\x01\xa4",  # TSC_CTRL: XYZ, enable! / TSC_CFG: 4 sample, 1ms delay, 5ms settle
+    b"\x20\x60\x02",  # ADC_CTRL1: 10 bit, 96 clocks per conversion / ADC_CTRL2: 6.5MHz
+    b"\x56\x06",  # TSC_FRACTION_Z
+    # The FIFO_STA reset bit isn't self-clearing and its neighbor FIFO_SIZE is
+    # read-only, so the reset/unreset pair can't be merged into one burst.
+    b"\x4b\x01",  # FIFO_STA: reset
+    b"\x4b\x00",  # FIFO_STA: unreset
+    b"\x58\x01",  # TSC_I_DRIVE: 50mA
+)
+
 
 class Adafruit_STMPE610:
     """A class (driver) for the STMPE610 Resistive Touch controller used by the
@@ -155,50 +173,112 @@ class Adafruit_STMPE610:
 
     See the examples folder for instantiation kwargs and properties."""
 
-    def __init__(self):
+    # Bus handle held by __enter__/begin_fast; None while not acquired. A
+    # class attribute so it exists before the interface constructors read the
+    # chip version, which happens ahead of super().__init__().
+    _bus = None
+    # How many times the bus has been acquired, so batches can nest without
+    # deadlocking on the already-held lock or releasing it early.
+    _bus_depth = 0
+
+    def __init__(self, irq=None, fifo_threshold=1):
         """Reset the controller."""
-        self._write_register_byte(_STMPE_SYS_CTRL1, _STMPE_SYS_CTRL1_RESET)
-        time.sleep(0.001)
-
-        self._write_register_byte(_STMPE_SYS_CTRL2, 0x0)  # turn on clocks!
-        self._write_register_byte(
-            _STMPE_TSC_CTRL, _STMPE_TSC_CTRL_XYZ | _STMPE_TSC_CTRL_EN
-        )  # XYZ and enable!
-        self._write_register_byte(_STMPE_INT_EN, _STMPE_INT_EN_TOUCHDET)
-        self._write_register_byte(
-            _STMPE_ADC_CTRL1, _STMPE_ADC_CTRL1_10BIT | (0x6 << 4)
-        )  # 96 clocks per conversion
-        self._write_register_byte(_STMPE_ADC_CTRL2, _STMPE_ADC_CTRL2_6_5MHZ)
-        self._write_register_byte(
-            _STMPE_TSC_CFG,
-            _STMPE_TSC_CFG_4SAMPLE
-            | _STMPE_TSC_CFG_DELAY_1MS
-            | _STMPE_TSC_CFG_SETTLE_5MS,
-        )
-        self._write_register_byte(_STMPE_TSC_FRACTION_Z, 0x6)
-        self._write_register_byte(_STMPE_FIFO_TH, 1)
-        self._write_register_byte(_STMPE_FIFO_STA, _STMPE_FIFO_STA_RESET)
-        self._write_register_byte(_STMPE_FIFO_STA, 0)  # Unreset
-        self._write_register_byte(_STMPE_TSC_I_DRIVE, _STMPE_TSC_I_DRIVE_50MA)
-        self._write_register_byte(_STMPE_INT_STA, 0xFF)  # Reset all ints
-        self._write_register_byte(
-            _STMPE_INT_CTRL, _STMPE_INT_CTRL_POL_HIGH | _STMPE_INT_CTRL_ENABLE
-        )
+        if not 1 <= fifo_threshold <= 127:
+            raise ValueError("FIFO threshold value must be 1-127")
+        self._irq = irq
+        if irq is not None:
+            irq.switch_to_input()
+        self._ints_pending = False
+        int_en = _STMPE_INT_EN_TOUCHDET
+        if fifo_threshold > 1:
+            int_en |= _STMPE_INT_EN_FIFOTH
+        with self:
+            self._write_raw(_RESET_PKT)
+            time.sleep(0.001)
+            for pkt in _INIT_SEQ:
+                self._write_raw(pkt)
+            # The FIFO threshold and interrupt mask depend on fifo_threshold,
+            # so they're written outside the constant sequence.
+            self._write_register_byte(_STMPE_FIFO_TH, fifo_threshold)
+            # INT_CTRL, INT_EN and INT_STA are contiguous - one burst sets the
+            # polarity/enable, the mask, and resets all ints.
+            self._write_registers(
+                _STMPE_INT_CTRL,
+                [_STMPE_INT_CTRL_POL_HIGH | _STMPE_INT_CTRL_ENABLE, int_en, 0xFF],
+            )
 
     def read_data(self):
         """Request next stored reading - return tuple containing (x,y,pressure)."""
-        d_1 = self._read_byte(0xD7)
-        d_2 = self._read_byte(0xD7)
-        d_3 = self._read_byte(0xD7)
-        d_4 = self._read_byte(0xD7)
+        # The data register auto-advances through the FIFO sample, so all
+        # four bytes can be fetched in a single transaction.
+        d_1, d_2, d_3, d_4 = self._read_register(0xD7, 4)
         x_loc = d_1 << 4 | d_2 >> 4
         y_loc = (d_2 & 0xF) << 8 | d_3
         pressure = d_4
-        # Reset all ints  (not sure what this does)
-        if self.buffer_empty:
-            self._write_register_byte(_STMPE_INT_STA, 0xFF)
+        # Don't spend a FIFO status read per sample just to decide whether to
+        # reset the interrupt flags - note they're stale and clear them lazily
+        # on the next touch check instead.
+        self._ints_pending = True
         return (x_loc, y_loc, pressure)
 
+    def read_batch(self):
+        """Read every buffered sample in one burst read and return a list of
+        (x,y,pressure) tuples; an empty list if the FIFO is empty. With a
+        ``fifo_threshold`` greater than one, waking on the interrupt and
+        calling this amortizes the per-transaction overhead across all the
+        samples accumulated since the last read."""
+        count = self.buffer_size
+        if not count:
+            return []
+        data = self._read_register(0xD7, 4 * count)
+        samples = []
+        for i in range(0, 4 * count, 4):
+            d_1, d_2, d_3, d_4 = data[i : i + 4]
+            samples.append((d_1 << 4 | d_2 >> 4, (d_2 & 0xF) << 8 | d_3, d_4))
+        self._ints_pending = True
+        return samples
+
+    def __enter__(self):
+        """Acquire and hold the underlying bus for a batch of register
+        accesses, so each access skips the per-transaction lock and bus
+        configuration overhead::
+
+            with touch_sensor:
+                while not touch_sensor.buffer_empty:
+                    point = touch_sensor.read_data()
+
+        Batches may nest - the bus is only released when the outermost one
+        ends."""
+        if self._bus is None:
+            self._bus = self._acquire_bus()
+        self._bus_depth += 1
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        if self._bus is None:
+            return
+        self._bus_depth -= 1
+        if self._bus_depth < 1:
+            self._bus_depth = 0
+            self._bus = None
+            self._release_bus()
+
+    def _acquire_bus(self):
+        """Lock and configure the underlying bus once, returning the handle
+        reused by register accesses until :meth:`_release_bus`.
+        Subclasses MUST implement this!"""
+        raise NotImplementedError
+
+    def _release_bus(self):
+        """Release the bus acquired by :meth:`_acquire_bus`.
+        Subclasses MUST implement this!"""
+        raise NotImplementedError
+
+    def _clear_ints(self):
+        """Reset all interrupt status flags."""
+        self._write_register_byte(_STMPE_INT_STA, 0xFF)
+        self._ints_pending = False
+
     def _read_byte(self, register):
         """Read a byte register value and return it."""
         return self._read_register(register, 1)[0]
@@ -214,29 +294,75 @@ class Adafruit_STMPE610:
         Subclasses MUST implement this!"""
         raise NotImplementedError
 
+    def _write_registers(self, register, values):
+        """Write a list of byte values to contiguous registers starting at the
+        specified register address, using the controller's address
+        auto-increment to do so in a single transaction.
+        Subclasses MUST implement this!"""
+        raise NotImplementedError
+
+    def _write_raw(self, buffer):
+        """Write a pre-built packet - a register address followed by value
+        bytes - to the controller in one transaction.
+        Subclasses MUST implement this!"""
+        raise NotImplementedError
+
+    def sleep(self):
+        """Put the controller into its low-power hibernate mode. Touches are
+        not detected while hibernating; call :meth:`wake` to resume."""
+        self._write_register_byte(_STMPE_SYS_CTRL1, _STMPE_SYS_CTRL1_HIBERNATE)
+
+    def wake(self):
+        """Wake the controller from hibernate mode."""
+        self._write_register_byte(_STMPE_SYS_CTRL1, 0x00)
+
+    @property
+    def data_available(self):
+        """Whether touch data is waiting to be read. When an ``irq`` pin was
+        provided, this checks the interrupt line without any bus traffic;
+        otherwise it falls back to reading the FIFO status register."""
+        if self._ints_pending:
+            self._clear_ints()
+        if self._irq is not None:
+            return self._irq.value
+        return not self.buffer_empty
+
     @property
     def touches(self):
         """Returns a list of touchpoint dicts, with 'x' and 'y' containing the
-        touch coordinates, and 'pressure'."""
+        touch coordinates, and 'pressure'.
+
+        A fresh list and dicts are allocated on every call; in a tight polling
+        loop prefer :meth:`read_data` or :meth:`get_point_into`, which don't
+        allocate."""
         touchpoints = []
+        if self._ints_pending:
+            self._clear_ints()
+        if self._irq is not None and not self._irq.value:
+            return touchpoints
         while (len(touchpoints) < 4) and not self.buffer_empty:
             (x_loc, y_loc, pressure) = self.read_data()
             point = {"x": x_loc, "y": y_loc, "pressure": pressure}
             touchpoints.append(point)
         return touchpoints
 
-    @property
-    def get_version(self):
+    def _read_version(self):
         """Read the version number from the sensor."""
-        v_1 = self._read_byte(0)
-        v_2 = self._read_byte(1)
+        # The two ID registers are adjacent - read both in one burst.
+        v_1, v_2 = self._read_register(0, 2)
         version = v_1 << 8 | v_2
         # print("version ",hex(version))
         return version
 
+    # Kept as a property for backward compatibility; note it performs a bus
+    # read on every access.
+    get_version = property(_read_version)
+
     @property
     def touched(self):
         """Report if any touches were detected."""
+        if self._ints_pending:
+            self._clear_ints()
         touch = self._read_byte(_STMPE_TSC_CTRL) & 0x80
         return touch == 0x80
 
@@ -258,6 +384,14 @@ class Adafruit_STMPE610:
         point = {"x": x_loc, "y": y_loc, "pressure": pressure}
         return point
 
+    def get_point_into(self, point):
+        """Read one touch from the buffer into the supplied dict, setting its
+        'x', 'y' and 'pressure' keys, and return it. Unlike :meth:`get_point`
+        no new dict is allocated, so a polling loop can reuse one dict without
+        creating garbage."""
+        point["x"], point["y"], point["pressure"] = self.read_data()
+        return point
+
 
 class Adafruit_STMPE610_I2C(Adafruit_STMPE610):
     """I2C interface class for the STMPE610 Resistive Touch sensor.
@@ -273,6 +407,12 @@ class Adafruit_STMPE610_I2C(Adafruit_STMPE610):
     :param (bool, bool) touch_flip: swap touchscreen axis range minimum and
      maximum values for (x, y) axes as referenced to display 0-degree rotation.
      Defaults to (False, False).
+    :param None, digitalio.DigitalInOut irq: pin connected to the controller's
+     interrupt output, used to detect pending touch data without bus traffic.
+     Defaults to None.
+    :param int fifo_threshold: number of buffered samples that triggers the
+     FIFO threshold interrupt, for batch reading with :meth:`read_batch`.
+     Defaults to 1.
 
     ** Quickstart: Importing and instantiating Adafruit_STMPE610_I2C**
 
@@ -297,6 +437,8 @@ class Adafruit_STMPE610_I2C(Adafruit_STMPE610):
         size=None,
         disp_rotation=0,
         touch_flip=(False, False),
+        irq=None,
+        fifo_threshold=1,
     ):
 
         self._calib = calibration
@@ -317,11 +459,16 @@ class Adafruit_STMPE610_I2C(Adafruit_STMPE610):
         import adafruit_bus_device.i2c_device as i2cdev  # pylint: disable=import-outside-toplevel
 
         self._i2c = i2cdev.I2CDevice(i2c, address)
+        # Scratch buffers reused by every transaction, to avoid allocating
+        # (and garbage collecting) fresh buffers in the touch-polling loop.
+        self._addr_buf = bytearray(1)
+        self._w2_buf = bytearray(2)
+        self._read_buf = bytearray(4)
         # Check device version.
-        version = self.get_version
+        version = self._read_version()
         if _STMPE_VERSION != version:
             raise RuntimeError("Failed to find STMPE610! Chip Version 0x%x" % version)
-        super().__init__()
+        super().__init__(irq=irq, fifo_threshold=fifo_threshold)
 
     @property
     def touch_point(self):  # pylint: disable=too-many-branches
@@ -330,6 +477,8 @@ class Adafruit_STMPE610_I2C(Adafruit_STMPE610):
         :return: x, y, pressure
         rtype: int, int, int
         """
+        if self._ints_pending:
+            self._clear_ints()
         if not self.buffer_empty:
             while not self.buffer_empty:
                 x_loc, y_loc, pressure = self.read_data()
@@ -369,19 +518,66 @@ class Adafruit_STMPE610_I2C(Adafruit_STMPE610):
         return None
 
     def _read_register(self, register, length):
-        """Low level register reading over I2C, returns a list of values."""
-        with self._i2c as i2c:
-            i2c.write(bytearray([register & 0xFF]))
-            result = bytearray(length)
-            i2c.readinto(result)
-            # print("$%02X => %s" % (register, [hex(i) for i in result]))
-            return result
+        """Low level register reading over I2C, returns a memoryview of the
+        retrieved data. The underlying scratch buffer is reused by the next
+        read, so unpack or copy the values before reading again."""
+        if length > len(self._read_buf):
+            self._read_buf = bytearray(length)
+        result = memoryview(self._read_buf)[:length]
+        self._addr_buf[0] = register & 0xFF
+        # A single combined transaction, with a repeated START between the
+        # register address and the read rather than a STOP/START pair.
+        if self._bus is not None:
+            self._bus.write_then_readinto(self._addr_buf, result)
+        else:
+            with self._i2c as i2c:
+                i2c.write_then_readinto(self._addr_buf, result)
+        # print("$%02X => %s" % (register, [hex(i) for i in result]))
+        return result
 
     def _write_register_byte(self, register, value):
         """Low level register writing over I2C, writes one 8-bit value."""
-        with self._i2c as i2c:
-            i2c.write(bytes([register & 0xFF, value & 0xFF]))
-            # print("$%02X <= 0x%02X" % (register, value))
+        self._w2_buf[0] = register & 0xFF
+        self._w2_buf[1] = value & 0xFF
+        self._write_raw(self._w2_buf)
+        # print("$%02X <= 0x%02X" % (register, value))
+
+    def _write_registers(self, register, values):
+        """Low level contiguous register writing over I2C, writes all values
+        in one auto-increment transaction starting at the given register."""
+        self._write_raw(
+            bytearray([register & 0xFF] + [value & 0xFF for value in values])
+        )
+
+    def _write_raw(self, buffer):
+        """Low level packet writing over I2C; the buffer holds the register
+        address followed by the value bytes."""
+        if self._bus is not None:
+            self._bus.write(buffer)
+        else:
+            with self._i2c as i2c:
+                i2c.write(buffer)
+
+    def begin_fast(self):
+        """Lock the I2C bus and keep it locked, so subsequent register
+        accesses skip the per-transaction lock-acquire loop. Only use this
+        when no other device shares the bus, and call :meth:`end_fast` to
+        release it; for a bounded batch prefer ``with touch_sensor:``, which
+        may also be nested inside a fast region."""
+        self.__enter__()
+
+    def end_fast(self):
+        """Release the I2C bus locked by :meth:`begin_fast`."""
+        self.__exit__(None, None, None)
+
+    def _acquire_bus(self):
+        """Lock the I2C bus once; register accesses reuse the locked device
+        until :meth:`_release_bus`."""
+        return self._i2c.__enter__()
+
+    def _release_bus(self):
+        """Unlock the I2C bus."""
+        self._i2c.__exit__(None, None, None)
 
 
 class Adafruit_STMPE610_SPI(Adafruit_STMPE610):
@@ -400,6 +596,12 @@ class Adafruit_STMPE610_SPI(Adafruit_STMPE610):
     :param (bool, bool) touch_flip: swap touchscreen axis range minimum and
      maximum values for (x, y) axes as referenced to display 0-degree rotation.
      Defaults to (False, False).
+    :param None, digitalio.DigitalInOut irq: pin connected to the controller's
+     interrupt output, used to detect pending touch data without bus traffic.
+     Defaults to None.
+    :param int fifo_threshold: number of buffered samples that triggers the
+     FIFO threshold interrupt, for batch reading with :meth:`read_batch`.
+     Defaults to 1.
 
     ** Quickstart: Importing and instantiating Adafruit_STMPE610_I2C**
 
@@ -426,6 +628,8 @@ class Adafruit_STMPE610_SPI(Adafruit_STMPE610):
         size=None,
         disp_rotation=0,
         touch_flip=(False, False),
+        irq=None,
+        fifo_threshold=1,
     ):
 
         self._calib = calibration
@@ -446,21 +650,26 @@ class Adafruit_STMPE610_SPI(Adafruit_STMPE610):
         import adafruit_bus_device.spi_device as spidev  # pylint: disable=import-outside-toplevel
 
         self._spi = spidev.SPIDevice(spi, cs, baudrate=baudrate)
+        # Scratch buffers reused by every transaction, to avoid allocating
+        # (and garbage collecting) fresh buffers in the touch-polling loop.
+        self._addr_buf = bytearray(1)
+        self._w2_buf = bytearray(2)
+        self._read_buf = bytearray(4)
         # Check device version.
-        version = self.get_version
+        version = self._read_version()
         if _STMPE_VERSION != version:
             # If it fails try SPI MODE 1  -- that is what Arduino does
             self._spi = spidev.SPIDevice(
                 spi, cs, baudrate=baudrate, polarity=0, phase=1
             )
-            version = self.get_version
+            version = self._read_version()
             if _STMPE_VERSION != version:
                 raise RuntimeError(
                     "Failed to find STMPE610 controller! Chip Version 0x%x. "
                     "If you are using the breakout, verify you are in SPI mode."
                     % version
                 )
-        super().__init__()
+        super().__init__(irq=irq, fifo_threshold=fifo_threshold)
 
     @property
     def touch_point(self):  # pylint: disable=too-many-branches
@@ -469,6 +678,8 @@ class Adafruit_STMPE610_SPI(Adafruit_STMPE610):
         :return: x, y, pressure
         rtype: int, int, int
         """
+        if self._ints_pending:
+            self._clear_ints()
         if not self.buffer_empty:
             while not self.buffer_empty:
                 x_loc, y_loc, pressure = self.read_data()
@@ -510,17 +721,62 @@ class Adafruit_STMPE610_SPI(Adafruit_STMPE610):
     # pylint: disable=no-member
     # Disable should be reconsidered when refactor can be tested.
     def _read_register(self, register, length):
-        """Low level register reading over SPI, returns a list of values."""
-        register = (register | 0x80) & 0xFF  # Read single byte, bit 7 high.
-        with self._spi as spi:
-            spi.write(bytearray([register]))
-            result = bytearray(length)
-            spi.readinto(result)
-            # print("$%02X => %s" % (register, [hex(i) for i in result]))
-            return result
+        """Low level register reading over SPI, returns a memoryview of the
+        retrieved data. The underlying scratch buffer is reused by the next
+        read, so unpack or copy the values before reading again."""
+        if length > len(self._read_buf):
+            self._read_buf = bytearray(length)
+        result = memoryview(self._read_buf)[:length]
+        self._addr_buf[0] = (register | 0x80) & 0xFF  # Read, bit 7 high.
+        if self._bus is not None:
+            chip_select = self._spi.chip_select
+            chip_select.value = False
+            try:
+                self._bus.write(self._addr_buf)
+                self._bus.readinto(result)
+            finally:
+                chip_select.value = True
+        else:
+            with self._spi as spi:
+                spi.write(self._addr_buf)
+                spi.readinto(result)
+        # print("$%02X => %s" % (register, [hex(i) for i in result]))
+        return result
 
     def _write_register_byte(self, register, value):
         """Low level register writing over SPI, writes one 8-bit value."""
+        self._w2_buf[0] = register & 0x7F  # Write, bit 7 low.
+        self._w2_buf[1] = value & 0xFF
+        self._write_raw(self._w2_buf)
+
+    def _write_registers(self, register, values):
+        """Low level contiguous register writing over SPI, writes all values
+        in one auto-increment transaction starting at the given register."""
         register &= 0x7F  # Write, bit 7 low.
-        with self._spi as spi:
-            spi.write(bytes([register, value & 0xFF]))
+        self._write_raw(bytearray([register] + [value & 0xFF for value in values]))
+
+    def _write_raw(self, buffer):
+        """Low level packet writing over SPI; the buffer holds the register
+        address (bit 7 already low for write) followed by the value bytes."""
+        if self._bus is not None:
+            chip_select = self._spi.chip_select
+            chip_select.value = False
+            try:
+                self._bus.write(buffer)
+            finally:
+                chip_select.value = True
+        else:
+            with self._spi as spi:
+                spi.write(buffer)
+
+    def _acquire_bus(self):
+        """Lock and configure the SPI bus once; register accesses reuse it
+        until :meth:`_release_bus`, with chip select still framing each
+        transfer individually."""
+        bus = self._spi.__enter__()
+        self._spi.chip_select.value = True  # Deassert until a transfer runs.
+        return bus
+
+    def _release_bus(self):
+        """Unlock the SPI bus."""
+        self._spi.__exit__(None, None, None)